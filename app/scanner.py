@@ -0,0 +1,256 @@
+import re
+from mmap import mmap
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+
+from app.tokens import LEXEMES, RESERVED_KEYWORDS, Token, TokenType
+
+__all__ = ["Scanner", "format_error"]
+
+
+# Character classes indexed by byte value, one bit per class. Bytes outside
+# the ASCII range have no class.
+DIGIT = 0x01
+ALPHA = 0x02
+WHITESPACE = 0x04
+CHAR_CLASS = bytes(
+    (DIGIT if 0x30 <= code <= 0x39 else 0)
+    | (ALPHA if 0x41 <= code <= 0x5A or 0x61 <= code <= 0x7A or code == 0x5F else 0)
+    | (WHITESPACE if code in b" \t" else 0)
+    for code in range(256)
+)
+
+# Identifier or reserved word: a letter or underscore followed by letters,
+# digits and underscores.
+IDENTIFIER_PATTERN = re.compile(rb"[A-Za-z_][A-Za-z0-9_]*")
+
+# Number literal: digits with an optional fractional part. Matched by the
+# regex engine in one call instead of a character loop.
+NUMBER_PATTERN = re.compile(rb"[0-9]+(?:\.[0-9]+)?")
+
+
+class Scanner:
+    """
+    Class responsible for scanning source code and generating tokens.
+    """
+    # Fixed attribute layout: scanner state is read on every character, and
+    # slot descriptors are cheaper to access than an instance __dict__.
+    __slots__ = ("source", "length", "start", "current", "line", "errors")
+
+    def __init__(self, source: Union[bytes, mmap]) -> None:
+        """
+        Initializes the Scanner with source code, as bytes or a read-only mmap.
+        """
+        self.source = source
+        self.length = len(source)
+        self.start = 0
+        self.current = 0
+        self.line = 1
+        # Errors are recorded as (line, unexpected character bytes) and only
+        # formatted for output; a character of None marks an unterminated string.
+        self.errors: List[Tuple[int, Optional[bytes]]] = []
+
+    def scan_tokens(self) -> Iterator[Token]:
+        """
+        Scans through the source code, yielding tokens as they are produced.
+        Errors are collected in self.errors.
+        """
+        # Hot loop: dispatch is inlined and the source, its length and the
+        # jump tables are held in locals so each character costs one table load.
+        # Operator tokens (one character, optionally followed by "=") are built
+        # right here with no handler call.
+        source = self.source
+        length = self.length
+        operator_tokens = OPERATOR_TOKENS
+        equal_pairs = EQUAL_PAIRS
+        lexemes = LEXEMES
+        handlers = HANDLERS
+        whitespace = _whitespace
+        while self.current < length:
+            self.start = self.current
+            code = source[self.current]
+            self.current += 1
+            token_type = operator_tokens[code]
+            if token_type is not None:
+                paired = equal_pairs[token_type]
+                if paired is not None and self.current < length and source[self.current] == 0x3D:
+                    token_type = paired
+                    self.current += 1
+                yield Token(token_type, lexemes[token_type], None, self.line)
+                continue
+            handler = handlers[code]
+            if handler is whitespace:
+                # Whitespace produces no token, so skip the handler call
+                continue
+            token = handler(self)
+            if token is not None:
+                yield token
+        yield Token(TokenType.EOF, "", None, self.line)
+
+    def unexpected_character(self) -> None:
+        """
+        Records an error for a character that cannot start a token.
+        Consumes the rest of a multi-byte UTF-8 sequence so it is reported once.
+        """
+        source = self.source
+        while self.current < self.length and 0x80 <= source[self.current] < 0xC0:
+            self.current += 1
+        self.errors.append((self.line, source[self.start:self.current]))
+
+    def string(self) -> Optional[Token]:
+        """
+        Handles string literals.
+        """
+        start_line = self.line
+        # The closing quote is located with one C-level search, and the
+        # lines spanned by the literal are counted in one pass over its bytes
+        # (an mmap source has find() but no count()).
+        source = self.source
+        end = source.find(b'"', self.current)
+        if end == -1:
+            # Count the remaining lines with find() rather than slicing the
+            # rest of the source, which would copy an mmap into memory.
+            newline = source.find(b"\n", self.current)
+            while newline != -1:
+                self.line += 1
+                newline = source.find(b"\n", newline + 1)
+            # A lone "\r" is a line break too; one followed by "\n" was
+            # counted above.
+            carriage_return = source.find(b"\r", self.current)
+            while carriage_return != -1:
+                if source[carriage_return + 1:carriage_return + 2] != b"\n":
+                    self.line += 1
+                carriage_return = source.find(b"\r", carriage_return + 1)
+            self.current = self.length
+            self.errors.append((start_line, None))
+            return None
+        self.current = end + 1
+        lexeme = source[self.start:self.current]
+        text = lexeme.decode()
+        if b"\r" in lexeme:
+            # Translate "\r\n" and lone "\r" to "\n", as reading the file
+            # in text mode would, so the token matches on every platform.
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+            self.line += text.count("\n")
+        else:
+            self.line += lexeme.count(b"\n")
+        return Token(TokenType.STRING, text, text[1:-1], start_line)
+
+    def number(self) -> Token:
+        """
+        Handles number literals.
+        """
+        text = NUMBER_PATTERN.match(self.source, self.start).group()
+        self.current = self.start + len(text)
+        # float() parses the ASCII bytes directly; the lexeme and the literal
+        # come from the same match instead of separate slices of the source.
+        return Token(TokenType.NUMBER, text.decode(), float(text), self.line)
+
+    def identifier(self) -> Token:
+        """
+        Handles identifiers and reserved words.
+        """
+        # Identifiers are the most frequent token: the run is matched by the
+        # regex engine and the token built here, without further method calls.
+        text = IDENTIFIER_PATTERN.match(self.source, self.start).group()
+        self.current = self.start + len(text)
+        token_type = RESERVED_KEYWORDS.get(text)
+        if token_type is None:
+            return Token(TokenType.IDENTIFIER, text.decode(), None, self.line)
+        return Token(token_type, LEXEMES[token_type], None, self.line)
+
+
+def _slash(scanner: Scanner) -> Optional[Token]:
+    """
+    Handles "/" which is either a division operator or the start of a comment.
+    """
+    source = scanner.source
+    current = scanner.current
+    if current < scanner.length and source[current] == 0x2F:
+        # Skip the comment up to the end of the line in one search. A lone
+        # "\r" also ends the line, so look for one before the "\n".
+        end = source.find(b"\n", current + 1)
+        if end == -1:
+            end = scanner.length
+        carriage_return = source.find(b"\r", current + 1, end)
+        scanner.current = end if carriage_return == -1 else carriage_return
+        return None
+    return Token(TokenType.SLASH, LEXEMES[TokenType.SLASH], None, scanner.line)
+
+
+def _whitespace(scanner: Scanner) -> None:
+    """
+    Ignores whitespace.
+    """
+    return None
+
+
+def _newline(scanner: Scanner) -> None:
+    """
+    Advances the line counter.
+    """
+    scanner.line += 1
+    return None
+
+
+def _carriage_return(scanner: Scanner) -> None:
+    """
+    Advances the line counter for a lone "\r"; in "\r\n" the "\n" does it.
+    """
+    current = scanner.current
+    if current >= scanner.length or scanner.source[current] != 0x0A:
+        scanner.line += 1
+    return None
+
+
+# Token types of the operators, indexed by the byte that starts them.
+# scan_tokens emits these inline, so their bytes never reach HANDLERS.
+# EQUAL_PAIRS maps an operator type, by value, to its two-character form when
+# it is followed by "=" (e.g. BANG to BANG_EQUAL), or None.
+OPERATOR_TOKENS: List[Optional[TokenType]] = [None] * 256
+for _char, _type in (
+    ("(", TokenType.LEFT_PAREN),
+    (")", TokenType.RIGHT_PAREN),
+    ("{", TokenType.LEFT_BRACE),
+    ("}", TokenType.RIGHT_BRACE),
+    ("*", TokenType.STAR),
+    (".", TokenType.DOT),
+    (",", TokenType.COMMA),
+    ("+", TokenType.PLUS),
+    ("-", TokenType.MINUS),
+    (";", TokenType.SEMICOLON),
+    ("!", TokenType.BANG),
+    ("=", TokenType.EQUAL),
+    ("<", TokenType.LESS),
+    (">", TokenType.GREATER),
+):
+    OPERATOR_TOKENS[ord(_char)] = _type
+EQUAL_PAIRS: List[Optional[TokenType]] = [None] * len(TokenType)
+EQUAL_PAIRS[TokenType.BANG] = TokenType.BANG_EQUAL
+EQUAL_PAIRS[TokenType.EQUAL] = TokenType.EQUAL_EQUAL
+EQUAL_PAIRS[TokenType.LESS] = TokenType.LESS_EQUAL
+EQUAL_PAIRS[TokenType.GREATER] = TokenType.GREATER_EQUAL
+
+# Jump table: HANDLERS[byte] is the handler for a token starting with that
+# byte. Every other byte has an entry; those that cannot start a token
+# (including all non-ASCII lead bytes) report an unexpected character.
+HANDLERS: List[Callable[[Scanner], Optional[Token]]] = [Scanner.unexpected_character] * 256
+HANDLERS[ord("/")] = _slash
+HANDLERS[ord("\n")] = _newline
+HANDLERS[ord("\r")] = _carriage_return
+HANDLERS[ord('"')] = Scanner.string
+for _code in range(256):
+    if CHAR_CLASS[_code] & DIGIT:
+        HANDLERS[_code] = Scanner.number
+    elif CHAR_CLASS[_code] & ALPHA:
+        HANDLERS[_code] = Scanner.identifier
+    elif CHAR_CLASS[_code] & WHITESPACE:
+        HANDLERS[_code] = _whitespace
+
+
+def format_error(line: int, char: Optional[bytes]) -> str:
+    """
+    Formats a scan error recorded by the Scanner.
+    """
+    if char is None:
+        return f"[line {line}] Error: Unterminated string."
+    return f"[line {line}] Error: Unexpected character: {char.decode(errors='replace')}"
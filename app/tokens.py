@@ -0,0 +1,125 @@
+import enum
+import sys
+from dataclasses import dataclass
+from typing import Any
+
+__all__ = ["TokenType", "TYPE_NAMES", "RESERVED_KEYWORDS", "LEXEMES", "Token"]
+
+
+class TokenType(enum.IntEnum):
+    """
+    Enum class for all possible token types.
+    """
+    LEFT_PAREN = 0
+    RIGHT_PAREN = 1
+    LEFT_BRACE = 2
+    RIGHT_BRACE = 3
+    STAR = 4
+    DOT = 5
+    COMMA = 6
+    PLUS = 7
+    MINUS = 8
+    SEMICOLON = 9
+    EQUAL = 10
+    EQUAL_EQUAL = 11
+    BANG = 12
+    BANG_EQUAL = 13
+    LESS = 14
+    LESS_EQUAL = 15
+    GREATER = 16
+    GREATER_EQUAL = 17
+    SLASH = 18
+    STRING = 19
+    NUMBER = 20
+    IDENTIFIER = 21
+    # Reserved words
+    AND = 22
+    CLASS = 23
+    ELSE = 24
+    FALSE = 25
+    FOR = 26
+    FUN = 27
+    IF = 28
+    NIL = 29
+    OR = 30
+    PRINT = 31
+    RETURN = 32
+    SUPER = 33
+    THIS = 34
+    TRUE = 35
+    VAR = 36
+    WHILE = 37
+    EOF = 38
+
+
+# Printable names indexed by token type value, so formatting a token is a
+# tuple index rather than an enum attribute lookup.
+TYPE_NAMES = tuple(token_type.name for token_type in TokenType)
+
+_OPERATOR_LEXEMES = {
+    TokenType.LEFT_PAREN: "(",
+    TokenType.RIGHT_PAREN: ")",
+    TokenType.LEFT_BRACE: "{",
+    TokenType.RIGHT_BRACE: "}",
+    TokenType.STAR: "*",
+    TokenType.DOT: ".",
+    TokenType.COMMA: ",",
+    TokenType.PLUS: "+",
+    TokenType.MINUS: "-",
+    TokenType.SEMICOLON: ";",
+    TokenType.EQUAL: "=",
+    TokenType.EQUAL_EQUAL: "==",
+    TokenType.BANG: "!",
+    TokenType.BANG_EQUAL: "!=",
+    TokenType.LESS: "<",
+    TokenType.LESS_EQUAL: "<=",
+    TokenType.GREATER: ">",
+    TokenType.GREATER_EQUAL: ">=",
+    TokenType.SLASH: "/",
+}
+
+RESERVED_KEYWORDS = {
+    b"and": TokenType.AND,
+    b"class": TokenType.CLASS,
+    b"else": TokenType.ELSE,
+    b"false": TokenType.FALSE,
+    b"for": TokenType.FOR,
+    b"fun": TokenType.FUN,
+    b"if": TokenType.IF,
+    b"nil": TokenType.NIL,
+    b"or": TokenType.OR,
+    b"print": TokenType.PRINT,
+    b"return": TokenType.RETURN,
+    b"super": TokenType.SUPER,
+    b"this": TokenType.THIS,
+    b"true": TokenType.TRUE,
+    b"var": TokenType.VAR,
+    b"while": TokenType.WHILE,
+}
+
+# Canonical lexemes for token types with a fixed spelling (operators and
+# reserved words), indexed by token type value; None for the rest. Tokens of
+# these types share one interned string instead of slicing the source.
+_FIXED_LEXEMES = {
+    **_OPERATOR_LEXEMES,
+    **{token_type: sys.intern(keyword.decode()) for keyword, token_type in RESERVED_KEYWORDS.items()},
+}
+LEXEMES = tuple(_FIXED_LEXEMES.get(token_type) for token_type in TokenType)
+
+
+@dataclass(slots=True)
+class Token:
+    """
+    Data class for tokens.
+    """
+    type: TokenType
+    lexeme: str
+    literal: Any
+    line: int
+
+    def __str__(self) -> str:
+        """
+        String representation of the Token.
+        """
+        literal_str = "null" if self.literal is None else str(self.literal)
+        return f"{TYPE_NAMES[self.type]} {self.lexeme} {literal_str}"